@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import logging
-from functools import partial
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, cast
 
-import nbformat
 from prompt_toolkit.buffer import Buffer, ValidationState
 from prompt_toolkit.filters.app import (
     buffer_has_focus,
@@ -32,6 +31,7 @@ from upath import UPath
 
 from euporie.core.commands import add_cmd, get_cmd
 from euporie.core.config import add_setting
+from euporie.core.current import get_app as get_base_app
 from euporie.core.diagnostics import Report
 from euporie.core.filters import (
     at_end_of_buffer,
@@ -70,6 +70,77 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _ends_double_nl(s: str) -> bool:
+    """Determine if a string ends with two newlines, without slicing."""
+    return len(s) >= 2 and s[-1] == s[-2] == "\n"
+
+
+@Condition
+def _empty() -> bool:
+    """Determine if the current buffer contains only whitespace."""
+    return not get_base_app().current_buffer.text.strip()
+
+
+@Condition
+def _not_invalid() -> bool:
+    """Determine if the current buffer has not failed validation."""
+    return get_base_app().current_buffer.validation_state != ValidationState.INVALID
+
+
+# Filter combinations shared by the command registrations below, built once at
+# import time rather than once per command
+_code_focused = buffer_is_code & buffer_has_focus
+_code_empty = buffer_is_code & buffer_is_empty
+
+
+@lru_cache
+def _load_input_kb() -> KeyBindings:
+    """Build the console input key-bindings.
+
+    The bindings only reference the currently focused buffer, so a single
+    instance is built lazily and shared by every console tab.
+    """
+    input_kb = KeyBindings()
+
+    @input_kb.add(
+        "enter",
+        filter=has_focus("code")
+        & ~_empty
+        & _not_invalid
+        & at_end_of_buffer
+        & ~has_completions,
+    )
+    async def on_enter(event: KeyPressEvent) -> NotImplementedOrNone:
+        """Accept input if the input is valid, otherwise insert a return."""
+        buffer = event.current_buffer
+        # Accept the buffer if there are 2 blank lines
+        accept = _ends_double_nl(buffer.text)
+        # Also accept if the input is valid
+        if not accept:
+            accept = buffer.validate(set_cursor=False)
+        if accept:
+            if buffer.accept_handler:
+                keep_text = buffer.accept_handler(buffer)
+            else:
+                keep_text = False
+            # buffer.append_to_history()
+            if not keep_text:
+                buffer.reset()
+            return NotImplemented
+
+        # Process the input as a regular :kbd:`enter` key-press
+        event.key_processor.feed(event.key_sequence[0], first=True)
+        # Prevent the app getting invalidated
+        return None
+
+    @input_kb.add("s-enter")
+    def _newline(event: KeyPressEvent) -> None:
+        """Force new line on Shift-Enter."""
+        event.current_buffer.newline(copy_margin=not in_paste_mode())
+
+    return input_kb
+
+
 class Console(KernelTab):
     """Interactive console.
 
@@ -106,7 +177,7 @@ class Console(KernelTab):
             add_output=self.new_output,
             clear_output=self.clear_output,
             # set_metadata=self.misc_callback,
-            set_status=lambda status: self.app.invalidate(),
+            set_status=lambda status: self.app.invalidate_soon(),
             set_kernel_info=self.set_kernel_info,
             done=self.complete,
             dead=self.kernel_died,
@@ -129,9 +200,25 @@ class Console(KernelTab):
         self.lang_info: dict[str, Any] = {}
         self.execution_count = 0
         self.clear_outputs_on_output = False
-
-        self.json = nbformat.v4.new_notebook()
-        self.json["metadata"] = self._metadata
+        # Outputs queued for display on the next event-loop tick
+        self._pending_outputs: list[dict[str, Any]] = []
+        # Cache of code completeness statuses returned by the kernel
+        self._is_complete_cache: dict[str, str] = {}
+        # Cache the setting item, as its value is checked on every execution
+        self._autoformat_setting = app.config.get_item("autoformat")
+        # Cache of rendered prompts, keyed by count, offset, status and text
+        self._prompt_cache: dict[
+            tuple[int, int, bool, str], StyleAndTextTuples
+        ] = {}
+
+        # Use a plain dict rather than :py:func:`nbformat.v4.new_notebook` - the
+        # JSON is only validated by :py:mod:`nbformat` if the session is saved
+        self.json = {
+            "cells": [],
+            "metadata": self._metadata,
+            "nbformat": 4,
+            "nbformat_minor": 4,
+        }
 
         self.container = self.load_container()
 
@@ -189,13 +276,20 @@ class Console(KernelTab):
     def validate_input(self, code: str) -> bool:
         """Determine if the entered code is ready to run."""
         assert self.kernel is not None
-        completeness_status = self.kernel.is_complete(code, wait=True).get(
-            "status", "unknown"
-        )
-        if (
-            not code.strip()
-            or completeness_status == "incomplete"
-            or (completeness_status == "unknown" and code[-2:] != "\n\n")
+        if not code.strip():
+            return False
+        # Memoize the completeness status so repeated validation of the same
+        # buffer text does not each cost a blocking kernel round-trip
+        completeness_status = self._is_complete_cache.get(code)
+        if completeness_status is None:
+            completeness_status = self.kernel.is_complete(code, wait=True).get(
+                "status", "unknown"
+            )
+            if len(self._is_complete_cache) > 128:
+                self._is_complete_cache.clear()
+            self._is_complete_cache[code] = completeness_status
+        if completeness_status == "incomplete" or (
+            completeness_status == "unknown" and not _ends_double_nl(code)
         ):
             return False
         return True
@@ -206,10 +300,13 @@ class Console(KernelTab):
             buffer = self.input_box.buffer
         app = self.app
         # Auto-reformat code
-        if app.config.autoformat:
+        if self._autoformat_setting.value:
             self.input_box.reformat()
         # Get the code to run
         text = buffer.text
+        # Skip the kernel round-trip entirely for empty input
+        if not text.strip():
+            return
         # Remove any selections from input
         buffer.selection_state = None
         # Disable existing output
@@ -218,33 +315,45 @@ class Console(KernelTab):
         self.reports.clear()
         # Move cursor to the start of the input
         buffer.cursor_position = 0
+        # Record the input as a cell in the json before submission, so outputs
+        # arriving from the kernel thread have a cell to attach to.
+        # Append a plain dict rather than a :py:func:`nbformat.v4.new_code_cell`,
+        # which would run schema validation on every execution
+        self.json["cells"].append(
+            {
+                "cell_type": "code",
+                "source": text,
+                "execution_count": self.execution_count + 1,
+                "metadata": {},
+                "outputs": [],
+            }
+        )
+        if (
+            app.config.max_stored_outputs
+            and len(self.json["cells"]) > app.config.max_stored_outputs
+        ):
+            del self.json["cells"][0]
+        # Submit the entry to the kernel before re-drawing the app, so the
+        # kernel starts computing while we block on terminal output
+        if self.kernel.status == "starting":
+            self.enqueue_kernel_task(partial(self.kernel.run, text, wait=False))
+        else:
+            self.kernel.run(text, wait=False)
         # Re-render the app and move to below the current output
         original_layout = app.layout
         app.layout = self.input_layout
         app.draw()
         app.layout = original_layout
+        # Increment this for display purposes until we get the response from
+        # the kernel - after the echo draw, so the frozen prompt shows the
+        # number the user typed at
+        self.execution_count += 1
         # Prevent displayed graphics on terminal being cleaned up (bit of a hack)
         app.graphics.clear()
-        # Run the previous entry
-        if self.kernel.status == "starting":
-            self.kernel_queue.append(partial(self.kernel.run, text, wait=False))
-        else:
-            self.kernel.run(text, wait=False)
-        # Increment this for display purposes until we get the response from the kernel
-        self.execution_count += 1
         # Reset the input & output
         buffer.reset(append_to_history=True)
         # Remove any live outputs and disable mouse support
         self.live_output.reset()
-        # Record the input as a cell in the json
-        self.json["cells"].append(
-            nbformat.v4.new_code_cell(source=text, execution_count=self.execution_count)
-        )
-        if (
-            app.config.max_stored_outputs
-            and len(self.json["cells"]) > app.config.max_stored_outputs
-        ):
-            del self.json["cells"][0]
         self.on_advance()
 
     def new_output(self, output_json: dict[str, Any]) -> None:
@@ -264,10 +373,22 @@ class Console(KernelTab):
             # Use a live output to display widgets
             self.live_output.add_output(output_json)
         else:
-            # Queue the output json
-            self.output.add_output(output_json)
-            # Invalidate the app so the output get printed
-            self.app.invalidate()
+            # Queue the output json, and display all queued outputs as a single
+            # batch on the next event-loop tick
+            self._pending_outputs.append(output_json)
+            if len(self._pending_outputs) == 1:
+                if (loop := self.app.loop) is not None:
+                    loop.call_soon_threadsafe(self._flush_outputs)
+                else:
+                    self._flush_outputs()
+
+    def _flush_outputs(self) -> None:
+        """Add any queued outputs to the output area and request a redraw."""
+        if pending := self._pending_outputs:
+            self._pending_outputs = []
+            self.output.add_outputs(pending, refresh=False)
+            # Invalidate the app so the outputs get printed
+            self.app.invalidate_soon()
 
     def render_outputs(self, app: Application[Any]) -> None:
         """Request that any unrendered outputs be rendered."""
@@ -290,20 +411,27 @@ class Console(KernelTab):
 
     def complete(self, content: dict | None = None) -> None:
         """Re-render any changes."""
-        self.app.invalidate()
+        self.app.invalidate_soon()
 
     def prompt(
         self, text: str, offset: int = 0, show_busy: bool = False
     ) -> StyleAndTextTuples:
         """Determine what should be displayed in the prompt of the cell."""
-        prompt = str(self.execution_count + offset)
-        if show_busy and self.kernel.status in ("busy", "queued"):
-            prompt = "*".center(len(prompt))
-        ft: StyleAndTextTuples = [
-            ("", f"{text}["),
-            ("class:count", prompt),
-            ("", "]: "),
-        ]
+        busy = show_busy and self.kernel.status in ("busy", "queued")
+        # Memoize the formatted text, as this is called on every render
+        key = (self.execution_count, offset, busy, text)
+        if (ft := self._prompt_cache.get(key)) is None:
+            prompt = str(self.execution_count + offset)
+            if busy:
+                prompt = "*".center(len(prompt))
+            ft = [
+                ("", f"{text}["),
+                ("class:count", prompt),
+                ("", "]: "),
+            ]
+            if len(self._prompt_cache) > 8:
+                self._prompt_cache.clear()
+            self._prompt_cache[key] = ft
         return ft
 
     @property
@@ -372,58 +500,7 @@ class Console(KernelTab):
 
         # Input area
 
-        input_kb = KeyBindings()
-
-        @Condition
-        def empty() -> bool:
-            from euporie.console.app import get_app
-
-            buffer = get_app().current_buffer
-            text = buffer.text
-            return not text.strip()
-
-        @Condition
-        def not_invalid() -> bool:
-            from euporie.console.app import get_app
-
-            buffer = get_app().current_buffer
-            return buffer.validation_state != ValidationState.INVALID
-
-        @input_kb.add(
-            "enter",
-            filter=has_focus("code")
-            & ~empty
-            & not_invalid
-            & at_end_of_buffer
-            & ~has_completions,
-        )
-        async def on_enter(event: KeyPressEvent) -> NotImplementedOrNone:
-            """Accept input if the input is valid, otherwise insert a return."""
-            buffer = event.current_buffer
-            # Accept the buffer if there are 2 blank lines
-            accept = buffer.text[-2:] == "\n\n"
-            # Also accept if the input is valid
-            if not accept:
-                accept = buffer.validate(set_cursor=False)
-            if accept:
-                if buffer.accept_handler:
-                    keep_text = buffer.accept_handler(buffer)
-                else:
-                    keep_text = False
-                # buffer.append_to_history()
-                if not keep_text:
-                    buffer.reset()
-                return NotImplemented
-
-            # Process the input as a regular :kbd:`enter` key-press
-            event.key_processor.feed(event.key_sequence[0], first=True)
-            # Prevent the app getting invalidated
-            return None
-
-        @input_kb.add("s-enter")
-        def _newline(event: KeyPressEvent) -> None:
-            """Force new line on Shift-Enter."""
-            event.current_buffer.newline(copy_margin=not in_paste_mode())
+        input_kb = _load_input_kb()
 
         input_prompt = Window(
             FormattedTextControl(partial(self.prompt, "In ", offset=1)),
@@ -648,7 +725,7 @@ class Console(KernelTab):
 
     @staticmethod
     @add_cmd(
-        filter=buffer_is_code & buffer_has_focus & ~has_selection & ~buffer_is_empty,
+        filter=_code_focused & ~has_selection & ~buffer_is_empty,
     )
     def _clear_input() -> None:
         """Clear the console input."""
@@ -659,7 +736,7 @@ class Console(KernelTab):
 
     @staticmethod
     @add_cmd(
-        filter=buffer_is_code & buffer_has_focus,
+        filter=_code_focused,
     )
     def _run_input() -> None:
         """Run the console input."""
@@ -673,7 +750,7 @@ class Console(KernelTab):
     @add_cmd(
         name="cc-interrupt-kernel",
         hidden=True,
-        filter=buffer_is_code & buffer_is_empty,
+        filter=_code_empty,
     )
     @add_cmd(filter=kernel_tab_has_focus)
     def _interrupt_kernel() -> None:
@@ -694,7 +771,7 @@ class Console(KernelTab):
 
     @staticmethod
     @add_cmd(
-        filter=buffer_is_code & buffer_is_empty,
+        filter=_code_empty,
         hidden=True,
         description="Signals the end of the input, causing the console to exit.",
     )
@@ -310,6 +310,9 @@ class BaseApp(Application):
         self.mouse_limits: WritePosition | None = None
         self.mouse_position = Point(0, 0)
 
+        # Flag set when a coalesced invalidation has been scheduled
+        self._invalidate_pending = False
+
         # Store LSP client instances
         self.lsp_clients: WeakValueDictionary[str, LspClient] = WeakValueDictionary()
 
@@ -330,6 +333,27 @@ class BaseApp(Application):
         if self.set_title():
             self.output.set_title(value)
 
+    def _flush_invalidate(self) -> None:
+        """Perform a previously scheduled invalidation."""
+        self._invalidate_pending = False
+        self.invalidate()
+
+    def invalidate_soon(self) -> None:
+        """Schedule at most one invalidation per event-loop iteration.
+
+        Kernel message callbacks can request a redraw for every message received,
+        which for chatty kernel output would trigger a render per message. This
+        coalesces any number of requests made during a single event-loop tick
+        into one call to :py:meth:`invalidate`. It is safe to call from threads
+        other than the event loop's thread.
+        """
+        if not self._invalidate_pending:
+            self._invalidate_pending = True
+            if (loop := self.loop) is not None:
+                loop.call_soon_threadsafe(self._flush_invalidate)
+            else:
+                self._flush_invalidate()
+
     def pause_rendering(self) -> None:
         """Block rendering, but allows input to be processed.
 
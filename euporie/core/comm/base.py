@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from abc import ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
-from weakref import WeakKeyDictionary
+from weakref import ref
 
 from euporie.core.convert.datum import Datum
 from euporie.core.current import get_app
@@ -53,8 +53,15 @@ class CommView:
             changes: A dictionary mapping changed key names to new values.
 
         """
+        setters = self.setters
+        if len(changes) == 1:
+            # Fast path for the common case of a single changed value
+            ((key, value),) = changes.items()
+            if setter := setters.get(key):
+                setter(value)
+            return
         for key, value in changes.items():
-            if setter := self.setters.get(key):
+            if setter := setters.get(key):
                 setter(value)
 
     def __pt_container__(self) -> AnyContainer:
@@ -85,7 +92,7 @@ class Comm(metaclass=ABCMeta):
         self.comm_id = comm_id
         self.data: dict[str, Any] = {}
         self.buffers: Sequence[bytes] = []
-        self.views: WeakKeyDictionary[CommView, OutputParent] = WeakKeyDictionary()
+        self.views: list[tuple[ref[CommView], ref[OutputParent]]] = []
         self.process_data(data, buffers)
 
     @abstractmethod
@@ -102,15 +109,28 @@ class Comm(metaclass=ABCMeta):
     def new_view(self, parent: OutputParent) -> CommView:
         """Create and register a new :class:`CommView` for this Comm."""
         view = self.create_view(parent)
-        self.views[view] = parent
+        self.views.append((ref(view), ref(parent)))
         return view
 
     def update_views(self, changes: dict) -> None:
         """Update all the active views of this Comm."""
-        for view, parent in self.views.items():
+        dead = 0
+        for view_ref, parent_ref in self.views:
+            view = view_ref()
+            parent = parent_ref()
+            if view is None or parent is None:
+                dead += 1
+                continue
             view.update(changes)
             parent.refresh(now=False)
-        get_app().invalidate()
+        # Periodically compact dead references out of the view list
+        if dead > 16:
+            self.views = [
+                (view_ref, parent_ref)
+                for view_ref, parent_ref in self.views
+                if view_ref() is not None and parent_ref() is not None
+            ]
+        get_app().invalidate_soon()
 
 
 class UnimplementedComm(Comm):
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+_SPECIAL_CHARS = re.compile("[\x01\x08\x1b\x9b]")
+
 
 class ANSI(PTANSI):
     """Convert ANSI text into formatted text, preserving all control sequences."""
@@ -39,23 +41,59 @@ class ANSI(PTANSI):
         # Remove hide & show cursor commands
         value = re.sub(r"\x1b\[\?25[hl]", "", value, count=0)
 
-        super().__init__(value)
+        self.value = value
+        self._formatted_text: list[tuple[str, str]] = []
+
+        # Default style attributes.
+        self._color: str | None = None
+        self._bgcolor: str | None = None
+        self._bold = False
+        self._dim = False
+        self._underline = False
+        self._strike = False
+        self._italic = False
+        self._blink = False
+        self._reverse = False
+        self._hidden = False
+
+        # Feed the text to the parser, sending maximal runs of plain characters
+        # in one go so each styled run becomes a single fragment, and stepping
+        # character by character only inside escape sequences
+        parser = self._parse_corot()
+        send = parser.send
+        search = _SPECIAL_CHARS.search
+        at_top = send(None)
+        pos = 0
+        end = len(value)
+        while pos < end:
+            if at_top:
+                match = search(value, pos)
+                start = match.start() if match is not None else end
+                if start > pos:
+                    send(value[pos:start])
+                    pos = start
+                    continue
+            at_top = bool(send(value[pos]))
+            pos += 1
 
-    def _parse_corot(self) -> Generator[None, str, None]:
+    def _parse_corot(self) -> Generator[bool | None, str, None]:
         """Coroutine that parses the ANSI escape sequences.
 
         This is modified version of the ANSI parser from prompt_toolkit retains
         all CSI escape sequences.
 
         Yields:
-            Accepts characters from a string.
+            Accepts characters (or runs of plain characters) from a string. The
+            top-of-loop yield produces :const:`True` to signal that a run of
+            plain characters may be sent as a single string; yields inside an
+            escape sequence produce :const:`None`.
 
         """
         style = ""
         formatted_text = self._formatted_text
 
         while True:
-            char = yield
+            char = yield True
             sequence = char
 
             # Everything between \001 and \002 should become a ZeroWidthEscape.
@@ -72,9 +110,13 @@ class ANSI(PTANSI):
 
             # Check for backspace
             elif char == "\x08":
-                # TODO - remove last character from last non-ZeroWidthEscape fragment
+                # TODO - skip over ZeroWidthEscape fragments
                 if formatted_text:
-                    formatted_text.pop()
+                    last_style, last_seq = formatted_text[-1]
+                    if len(last_seq) > 1:
+                        formatted_text[-1] = (last_style, last_seq[:-1])
+                    else:
+                        formatted_text.pop()
                 continue
 
             elif char in ("\x1b", "\x9b"):
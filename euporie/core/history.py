@@ -43,18 +43,21 @@ class KernelHistory(History):
             self.loading = True
             items = await self.kernel.history_(n=self.n, hist_access_type="tail")
             if items:
-                self._loaded_strings = [item[2] for item in reversed(items)]
-                # Remove sequential duplicates
-                self._loaded_strings = [
-                    v
-                    for i, v in enumerate(self._loaded_strings)
-                    if i == 0 or v != self._loaded_strings[i - 1]
-                ]
+                # Iterate in reverse with tuple unpacking, removing sequential
+                # duplicates in a single pass rather than re-indexing the list.
+                # All bookkeeping must complete before the first yield: the
+                # priming consumer pulls a single item and discards us, and
+                # subsequent loads read the cached state set here
+                strings: list[str] = []
+                prev: str | None = None
+                for _session, _line_no, source in reversed(items):
+                    if source != prev:
+                        strings.append(source)
+                    prev = source
+                self._loaded_strings = strings
                 self._loaded = True
-                self.n_loaded = len(self._loaded_strings)
-                log.debug(
-                    "Loaded %s items from kernel history", len(self._loaded_strings)
-                )
+                self.n_loaded = len(strings)
+                log.debug("Loaded %s items from kernel history", len(strings))
             self.loading = False
 
         for item in self._loaded_strings:
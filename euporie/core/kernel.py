@@ -9,6 +9,7 @@ import os
 import re
 import sys
 import threading
+import time
 from collections import defaultdict
 from subprocess import PIPE, STDOUT  # S404 - Security implications considered
 from typing import TYPE_CHECKING, TypedDict
@@ -35,6 +36,14 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+try:
+    # Use uvloop for the kernel thread's event loop if it is installed: every
+    # kernel message is a task wake-up, and libuv's scheduler primitives make
+    # those considerably cheaper than the default selector loop's
+    from uvloop import new_event_loop
+except ModuleNotFoundError:
+    from asyncio import new_event_loop
+
 
 class LoggingLocalProvisioner(LocalProvisioner):  # type:ignore[misc]
     """A Jupyter kernel provisionser which logs kernel output."""
@@ -125,6 +134,49 @@ class EuporieKernelManager(AsyncKernelManager):
         return [pat.sub(_from_ns, arg) for arg in cmd]
 
 
+def _output_from_msg(msg: dict[str, Any]) -> dict[str, Any]:
+    """Create a cell output dict from a kernel's IOPub message.
+
+    Equivalent to :py:func:`nbformat.v4.output_from_msg`, but builds a plain
+    dict without the JSON-schema validation run for every output; the
+    notebook JSON is validated by :py:mod:`nbformat` when it is saved.
+
+    Raises:
+        ValueError: If the message is not an output message.
+
+    """
+    msg_type = msg["header"]["msg_type"]
+    content = msg["content"]
+
+    if msg_type == "stream":
+        return {
+            "output_type": "stream",
+            "name": content["name"],
+            "text": content["text"],
+        }
+    if msg_type == "execute_result":
+        return {
+            "output_type": "execute_result",
+            "metadata": content["metadata"],
+            "data": content["data"],
+            "execution_count": content["execution_count"],
+        }
+    if msg_type in ("display_data", "update_display_data"):
+        return {
+            "output_type": "display_data",
+            "metadata": content["metadata"],
+            "data": content["data"],
+        }
+    if msg_type == "error":
+        return {
+            "output_type": "error",
+            "ename": content["ename"],
+            "evalue": content["evalue"],
+            "traceback": content["traceback"],
+        }
+    raise ValueError(f"Unrecognized output msg type: {msg_type!r}")
+
+
 class MsgCallbacks(TypedDict, total=False):
     """Typed dictionary for named message callbacks."""
 
@@ -172,7 +224,7 @@ class Kernel:
         """
         self.threaded = threaded
         if threaded:
-            self.loop = asyncio.new_event_loop()
+            self.loop = new_event_loop()
             self.thread = threading.Thread(target=self._setup_loop)
             self.thread.daemon = True
             self.thread.start()
@@ -188,11 +240,13 @@ class Kernel:
             kernel_name=str(kernel_tab.kernel_name),
         )
         self._status = "stopped"
+        self._last_status_time = 0.0
+        self._specs_cache: tuple[float, dict[str, dict]] | None = None
         self.error: Exception | None = None
         self.dead = False
         self.monitor_task: asyncio.Task | None = None
 
-        self.coros: dict[str, concurrent.futures.Future] = {}
+        self.coros: dict[str, concurrent.futures.Future | asyncio.Task] = {}
         self.poll_tasks: list[asyncio.Task] = []
 
         self.default_callbacks = MsgCallbacks(
@@ -213,6 +267,9 @@ class Kernel:
             # Return a copy of the default callbacks
             lambda: MsgCallbacks(dict(self.default_callbacks))  # type: ignore # mypy #8890
         )
+        # Completed executions awaiting their iopub idle status before their
+        # callbacks can be removed
+        self._done_msg_ids: set[str] = set()
 
         # Set the kernel folder list to prevent the default method from running.
         # This prevents the kernel spec manager from loading IPython, just for the
@@ -258,6 +315,22 @@ class Kernel:
             The result of the coroutine
 
         """
+        # When called from the kernel's own loop, schedule the coroutine
+        # directly: run_coroutine_threadsafe would pay for a lock and a loop
+        # wake-up only to target the loop we are already running on
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop and not wait:
+            task = self.loop.create_task(coro)
+            if single and self.coros.get(coro.__name__):
+                self.coros[coro.__name__].cancel()
+            self.coros[coro.__name__] = task
+            if callable(callback):
+                task.add_done_callback(lambda t: callback(t.result()))
+            return None
+
         future = asyncio.run_coroutine_threadsafe(coro, self.loop)
 
         # Cancel previous future instances if required
@@ -282,6 +355,16 @@ class Kernel:
                 return None
             return None
 
+    def callbacks_for(self, msg_id: str) -> MsgCallbacks:
+        """Look up the callbacks registered for a message without storing anything.
+
+        Indexing ``msg_id_callbacks`` directly would make the defaultdict
+        allocate and store a copy of the default callbacks for every message
+        id seen, including ones no caller registered an interest in.
+        """
+        callbacks = self.msg_id_callbacks.get(msg_id)
+        return self.default_callbacks if callbacks is None else callbacks
+
     def _set_living_status(self, alive: bool) -> None:
         """Set the life status of the kernel."""
         if not alive:
@@ -298,6 +381,10 @@ class Kernel:
         """Regularly monitor the kernel status."""
         while True:
             await asyncio.sleep(1)
+            # A recent status message proves the kernel is alive, so the
+            # liveness round-trip is only made when the kernel has gone quiet
+            if time.monotonic() - self._last_status_time < 1:
+                continue
             # Check kernel is alive - use client rather than manager if we have one
             # as we could be connected to a kernel not started by the manager
             if self.kc:
@@ -322,6 +409,7 @@ class Kernel:
     @status.setter
     def status(self, value: str) -> None:
         """Set the kernel status."""
+        self._last_status_time = time.monotonic()
         self.status_change_event.set()
         self._status = value
         self.status_change_event.clear()
@@ -359,7 +447,13 @@ class Kernel:
     @property
     def specs(self) -> dict[str, dict]:
         """Return a list of available kernelspecs."""
-        return self.km.kernel_spec_manager.get_all_specs()
+        # Cache the specs briefly: discovering them walks the jupyter data
+        # directories and reads every kernel.json, which is far too slow to
+        # repeat for each access from the UI
+        now = time.monotonic()
+        if self._specs_cache is None or now - self._specs_cache[0] > 5.0:
+            self._specs_cache = (now, self.km.kernel_spec_manager.get_all_specs())
+        return self._specs_cache[1]
 
     async def stop_(self, cb: Callable[[], Any] | None = None) -> None:
         """Stop the kernel asynchronously."""
@@ -451,9 +545,9 @@ class Kernel:
                         self.status = "idle"
                         self.error = None
                         self.poll_tasks = [
-                            asyncio.create_task(self.poll("shell")),
-                            asyncio.create_task(self.poll("iopub")),
-                            asyncio.create_task(self.poll("stdin")),
+                            asyncio.create_task(
+                                self.poll("shell", "iopub", "stdin")
+                            )
                         ]
                         self.dead = False
 
@@ -493,40 +587,85 @@ class Kernel:
             callback=cb,
         )
 
-    async def poll(self, channel: str) -> None:
-        """Poll for messages on a channel, and signal when they arrive.
+    async def poll(self, *channels: str) -> None:
+        """Poll for messages on the given channels, dispatching them on arrival.
+
+        The channels are multiplexed into this single task: the receive for
+        whichever channel completes is re-issued while the others stay
+        pending, so each message costs one task wake-up rather than keeping
+        one resident polling task per channel.
 
         Args:
-            channel: The name of the channel to get messages from
+            channels: The names of the channels to get messages from
 
         """
-        msg_getter_coro = getattr(self.kc, f"get_{channel}_msg")
-        log.debug("Waiting for %s messages", channel)
-        while True:
-            # log.debug("Waiting for next %s message", channel)
-            rsp = await msg_getter_coro()
-            # Run msg type handler
-            msg_type = rsp.get("header", {}).get("msg_type")
-            if callable(handler := getattr(self, f"on_{channel}_{msg_type}", None)):
-                handler(rsp)
-            else:
-                self.on_unhandled(channel, rsp)
+        msg_getters = {
+            channel: getattr(self.kc, f"get_{channel}_msg") for channel in channels
+        }
+        # Cache handler lookups, so each message costs a dict hit rather than
+        # a getattr with a freshly formatted attribute name
+        handlers: dict[
+            tuple[str, str | None], Callable[[dict[str, Any]], None] | None
+        ] = {}
+        log.debug("Waiting for %s messages", "/".join(channels))
+        pending: dict[asyncio.Task, str] = {
+            asyncio.ensure_future(getter()): channel
+            for channel, getter in msg_getters.items()
+        }
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    channel = pending.pop(task)
+                    rsp = task.result()
+                    # Re-issue the receive for this channel
+                    pending[asyncio.ensure_future(msg_getters[channel]())] = channel
+                    # Run msg type handler
+                    msg_type = rsp.get("header", {}).get("msg_type")
+                    key = (channel, msg_type)
+                    if key in handlers:
+                        handler = handlers[key]
+                    else:
+                        handler = getattr(self, f"on_{channel}_{msg_type}", None)
+                        if not callable(handler):
+                            handler = None
+                        handlers[key] = handler
+                    # A handler error must not kill this task: all channels
+                    # are polled here, so that would sever the whole kernel
+                    # connection rather than one channel's poller
+                    try:
+                        if handler is not None:
+                            handler(rsp)
+                        else:
+                            self.on_unhandled(channel, rsp)
+                    except Exception:
+                        log.exception(
+                            "Error handling %s message of type '%s'",
+                            channel,
+                            msg_type,
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
 
     def on_unhandled(self, channel: str, rsp: dict[str, Any]) -> None:
         """Report unhandled messages to the debug log."""
-        log.debug(
-            "Unhandled %s message:\nparent_id = '%s'\ntype = '%s'\ncontent='%s'",
-            channel,
-            rsp.get("parent_header", {}).get("msg_id"),
-            rsp["header"]["msg_type"],
-            rsp.get("content"),
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Unhandled %s message:\nparent_id = '%s'\ntype = '%s'\ncontent='%s'",
+                channel,
+                rsp.get("parent_header", {}).get("msg_id"),
+                rsp["header"]["msg_type"],
+                rsp.get("content"),
+            )
 
     def on_stdin_input_request(self, rsp: dict[str, Any]) -> None:
         """Call ``get_input`` callback for a stdin input request message."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         content = rsp.get("content", {})
-        if callable(get_input := self.msg_id_callbacks[msg_id].get("get_input")):
+        if callable(get_input := self.callbacks_for(msg_id).get("get_input")):
             get_input(
                 content.get("prompt", ""),
                 content.get("password", False),
@@ -536,12 +675,12 @@ class Kernel:
         """Call ``set_execution_count`` callback for a shell status response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         content = rsp.get("content", {})
-        status = rsp.get("content", {}).get("status", "")
+        status = content.get("status", "")
         if (
             status == "ok"
             and (execution_count := content.get("execution_count"))
             and callable(
-                set_execution_count := self.msg_id_callbacks[msg_id].get(
+                set_execution_count := self.callbacks_for(msg_id).get(
                     "set_execution_count"
                 )
             )
@@ -552,9 +691,10 @@ class Kernel:
         """Call callbacks for a shell execute reply response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         content = rsp.get("content", {})
+        callbacks = self.callbacks_for(msg_id)
 
         if self.kernel_tab.app.config.record_cell_timing and callable(
-            set_metadata := self.msg_id_callbacks[msg_id]["set_metadata"]
+            set_metadata := callbacks["set_metadata"]
         ):
             set_metadata(
                 ("execution", "shell.execute_reply"),
@@ -562,7 +702,7 @@ class Kernel:
             )
 
         if (execution_count := content.get("execution_count")) and callable(
-            set_execution_count := self.msg_id_callbacks[msg_id]["set_execution_count"]
+            set_execution_count := callbacks["set_execution_count"]
         ):
             set_execution_count(execution_count)
 
@@ -572,9 +712,9 @@ class Kernel:
 
                 if source == "page":
                     # Show pager output as a cell execution output
-                    if callable(
-                        add_output := self.msg_id_callbacks[msg_id]["add_output"]
-                    ) and (data := payload.get("data", {})):
+                    if callable(add_output := callbacks["add_output"]) and (
+                        data := payload.get("data", {})
+                    ):
                         add_output(
                             nbformat.v4.new_output(
                                 "execute_result",
@@ -582,60 +722,54 @@ class Kernel:
                             )
                         )
                 elif source == "set_next_input":
-                    if callable(
-                        set_next_input := self.msg_id_callbacks[msg_id][
-                            "set_next_input"
-                        ]
-                    ):
+                    if callable(set_next_input := callbacks["set_next_input"]):
                         set_next_input(
                             payload.get("text", ""),
                             payload.get("replace", False),
                         )
 
                 elif source == "edit_magic" and callable(
-                    edit_magic := self.msg_id_callbacks[msg_id]["edit_magic"]
+                    edit_magic := callbacks["edit_magic"]
                 ):
                     edit_magic(
                         payload.get("filename"),
                         int(payload.get("line_number") or 0),
                     )
 
-        if content.get("status") == "ok" and callable(
-            done := self.msg_id_callbacks[msg_id].get("done")
-        ):
+        if content.get("status") == "ok" and callable(done := callbacks.get("done")):
             done(content)
 
     def on_shell_kernel_info_reply(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for a shell kernel info response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         if callable(
-            set_kernel_info := self.msg_id_callbacks[msg_id].get("set_kernel_info")
+            set_kernel_info := self.callbacks_for(msg_id).get("set_kernel_info")
         ):
             set_kernel_info(rsp.get("content", {}))
 
     def on_shell_complete_reply(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for a shell completion reply response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(done := self.msg_id_callbacks[msg_id].get("done")):
+        if callable(done := self.callbacks_for(msg_id).get("done")):
             done(rsp.get("content", {}))
 
     def on_shell_history_reply(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for a shell history reply response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(done := self.msg_id_callbacks[msg_id].get("done")):
+        if callable(done := self.callbacks_for(msg_id).get("done")):
             done(rsp.get("content", {}))
 
     def on_shell_inspect_reply(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for a shell inspection reply response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(done := self.msg_id_callbacks[msg_id].get("done")):
+        if callable(done := self.callbacks_for(msg_id).get("done")):
             done(rsp.get("content", {}))
 
     def on_shell_is_complete_reply(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for a shell completeness reply response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         if callable(
-            completeness_status := self.msg_id_callbacks[msg_id].get(
+            completeness_status := self.callbacks_for(msg_id).get(
                 "completeness_status"
             )
         ):
@@ -645,25 +779,29 @@ class Kernel:
         """Call callbacks for an iopub status response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         status = rsp.get("content", {}).get("execution_state")
+        callbacks = self.callbacks_for(msg_id)
 
         self.status = status
-        if callable(set_status := self.msg_id_callbacks[msg_id].get("set_status")):
+        if callable(set_status := callbacks.get("set_status")):
             set_status(status)
 
         if status == "idle":
             if self.kernel_tab.app.config.record_cell_timing and callable(
-                set_metadata := self.msg_id_callbacks[msg_id].get("set_metadata")
+                set_metadata := callbacks.get("set_metadata")
             ):
                 set_metadata(
                     ("execution", "iopub.status.idle"),
                     rsp["header"]["date"].isoformat(),
                 )
+            # Remove the callbacks of executions which completed before their
+            # idle status arrived; see :py:meth:`run_`
+            if msg_id in self._done_msg_ids:
+                self._done_msg_ids.discard(msg_id)
+                self.msg_id_callbacks.pop(msg_id, None)
 
         elif status == "busy" and (
             self.kernel_tab.app.config.record_cell_timing
-            and callable(
-                set_metadata := self.msg_id_callbacks[msg_id].get("set_metadata")
-            )
+            and callable(set_metadata := callbacks.get("set_metadata"))
         ):
             set_metadata(
                 ("execution", "iopub.status.busy"),
@@ -674,7 +812,7 @@ class Kernel:
         """Call callbacks for an iopub execute input response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
         if self.kernel_tab.app.config.record_cell_timing and callable(
-            set_metadata := self.msg_id_callbacks[msg_id]["set_metadata"]
+            set_metadata := self.callbacks_for(msg_id)["set_metadata"]
         ):
             set_metadata(
                 ("execution", "iopub", "execute_input"),
@@ -684,49 +822,47 @@ class Kernel:
     def on_iopub_display_data(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for an iopub display data response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(add_output := self.msg_id_callbacks[msg_id]["add_output"]):
-            add_output(nbformat.v4.output_from_msg(rsp))
+        if callable(add_output := self.callbacks_for(msg_id)["add_output"]):
+            add_output(_output_from_msg(rsp))
 
     def on_iopub_update_display_data(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for an iopub update display data response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(add_output := self.msg_id_callbacks[msg_id]["add_output"]):
-            add_output(nbformat.v4.output_from_msg(rsp))
+        if callable(add_output := self.callbacks_for(msg_id)["add_output"]):
+            add_output(_output_from_msg(rsp))
 
     def on_iopub_execute_result(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for an iopub execute result response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(add_output := self.msg_id_callbacks[msg_id]["add_output"]):
-            add_output(nbformat.v4.output_from_msg(rsp))
+        callbacks = self.callbacks_for(msg_id)
+        if callable(add_output := callbacks["add_output"]):
+            add_output(_output_from_msg(rsp))
 
         if (execution_count := rsp.get("content", {}).get("execution_count")) and (
-            callable(
-                set_execution_count := self.msg_id_callbacks[msg_id][
-                    "set_execution_count"
-                ]
-            )
+            callable(set_execution_count := callbacks["set_execution_count"])
         ):
             set_execution_count(execution_count)
 
     def on_iopub_error(self, rsp: dict[str, dict[str, Any]]) -> None:
         """Call callbacks for an iopub error response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id", "")
-        if callable(add_output := self.msg_id_callbacks[msg_id].get("add_output")):
-            add_output(nbformat.v4.output_from_msg(rsp))
-        if callable(done := self.msg_id_callbacks[msg_id].get("done")):
+        callbacks = self.callbacks_for(msg_id)
+        if callable(add_output := callbacks.get("add_output")):
+            add_output(_output_from_msg(rsp))
+        if callable(done := callbacks.get("done")):
             done(rsp.get("content", {}))
 
     def on_iopub_stream(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for an iopub stream response."""
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(add_output := self.msg_id_callbacks[msg_id]["add_output"]):
-            add_output(nbformat.v4.output_from_msg(rsp))
+        if callable(add_output := self.callbacks_for(msg_id)["add_output"]):
+            add_output(_output_from_msg(rsp))
 
     def on_iopub_clear_output(self, rsp: dict[str, Any]) -> None:
         """Call callbacks for an iopub clear output response."""
         # Clear cell output, either now or when we get the next output
         msg_id = rsp.get("parent_header", {}).get("msg_id")
-        if callable(clear_output := self.msg_id_callbacks[msg_id]["clear_output"]):
+        if callable(clear_output := self.callbacks_for(msg_id)["clear_output"]):
             clear_output(rsp.get("content", {}).get("wait", False))
 
     '''
@@ -819,28 +955,44 @@ class Kernel:
             # Set the event
             event.set()
 
+        seen_idle = False
+
+        def wrapped_set_status(status: str) -> None:
+            """Record the iopub idle status before the ``set_status`` callback."""
+            nonlocal seen_idle
+            if status == "idle":
+                seen_idle = True
+            if callable(set_status):
+                set_status(status)
+
         callbacks = {
             "get_input": get_input,
             "set_execution_count": set_execution_count,
             "add_output": add_output,
             "clear_output": clear_output,
             "set_metadata": set_metadata,
-            "set_status": set_status,
+            "set_status": wrapped_set_status,
             "done": wrapped_done,
         }
         self.msg_id_callbacks[msg_id].update(
-            MsgCallbacks(filter(lambda x: x[1] is not None, callbacks.items()))  # type: ignore # mypy #8890
+            MsgCallbacks({key: value for key, value in callbacks.items() if value is not None})  # type: ignore # mypy #8890
         )
-        # Wait for "done" callback to be called
+        # Wait for "done" callback to be called. Awaiting the event directly
+        # avoids the wrapper task and extra wake-up asyncio.wait_for schedules
+        # per execution; with no timeout it offered no cancellation anyway
         try:
-            await asyncio.wait_for(event.wait(), timeout=None)
-        except asyncio.TimeoutError:
-            log.debug("Timed out waiting for kernel run response")
-
-        # Clean up callbacks
-        # await asyncio.sleep(0.1)
-        # if msg_id in self.msg_id_callbacks:
-        # del self.msg_id_callbacks[msg_id]
+            await event.wait()
+        finally:
+            # Remove the callbacks so the dict does not grow with every
+            # execution, but only once the iopub idle status for this message
+            # has also been seen: trailing iopub messages routinely arrive
+            # after the shell reply, and must not fall back to the default
+            # callbacks. If idle has not yet arrived, defer the removal to
+            # ``on_iopub_status``
+            if seen_idle:
+                self.msg_id_callbacks.pop(msg_id, None)
+            else:
+                self._done_msg_ids.add(msg_id)
 
     def info(
         self,
@@ -862,7 +1014,7 @@ class Kernel:
                 "set_status": _set_status,
             }
             self.msg_id_callbacks[msg_id].update(
-                MsgCallbacks(filter(lambda x: x[1] is not None, callbacks.items()))  # type: ignore # mypy #8890
+                MsgCallbacks({key: value for key, value in callbacks.items() if value is not None})  # type: ignore # mypy #8890
             )
 
     def comm_info(self, target_name: str | None = None) -> None:
@@ -1158,6 +1310,8 @@ class Kernel:
         """
         self.connection_file = connection_file
         self.status = "starting"
+        # Re-discover kernel specs, in case one was just installed
+        self._specs_cache = None
 
         # Update the tab's kernel spec
         spec = self.specs.get(name or "", {}).get("spec", {})
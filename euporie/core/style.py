@@ -207,9 +207,11 @@ IPYWIDGET_STYLE = [
 class ColorPaletteColor:
     """A representation of a color with adjustment methods."""
 
+    # The cache is shared by every color, and each style recalculation adjusts
+    # dozens of them, so the default size of 8 would thrash on every pass
     _cache: SimpleCache[
         tuple[str, float, float, float, bool], ColorPaletteColor
-    ] = SimpleCache()
+    ] = SimpleCache(maxsize=512)
 
     def __init__(self, base: str, _base_override: str = "") -> None:
         """Create a new color.
@@ -252,25 +254,22 @@ class ColorPaletteColor:
         brightness = min(max(-1, brightness), 1)
         saturation = min(max(-1, saturation), 1)
 
-        new_hue = self.hue + (self.hue * (hue < 0) + (1 - self.hue) * (hue > 0)) * hue
-
-        new_brightness = (
-            self.brightness
-            + (
-                self.brightness * (brightness < 0)
-                + (1 - self.brightness) * (brightness > 0)
-            )
-            * brightness
-        )
-
-        new_saturation = (
-            self.saturation
-            + (
-                self.saturation * (saturation < 0)
-                + (1 - self.saturation) * (saturation > 0)
-            )
-            * saturation
-        )
+        # Scale each adjustment by the head-room in its direction of travel
+        new_hue = self.hue
+        if hue:
+            new_hue += (new_hue if hue < 0 else 1 - new_hue) * hue
+
+        new_brightness = self.brightness
+        if brightness:
+            new_brightness += (
+                new_brightness if brightness < 0 else 1 - new_brightness
+            ) * brightness
+
+        new_saturation = self.saturation
+        if saturation:
+            new_saturation += (
+                new_saturation if saturation < 0 else 1 - new_saturation
+            ) * saturation
 
         r, g, b = hls_to_rgb(new_hue, new_brightness, new_saturation)
         new_color = f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
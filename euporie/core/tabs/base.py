@@ -399,6 +399,11 @@ class KernelTab(Tab, metaclass=ABCMeta):
             self.report_kernel_error(self.kernel.error)
 
         else:
+            # Load kernel history concurrently, overlapping the history
+            # request with the wait for the kernel to become idle
+            if self.use_kernel_history:
+                self.app.create_background_task(self.load_history())
+
             # Wait for an idle kernel
             if self.kernel.status != "idle":
                 self.kernel.wait_for_status("idle")
@@ -409,17 +414,37 @@ class KernelTab(Tab, metaclass=ABCMeta):
             # Load kernel info
             self.kernel.info(set_kernel_info=self.set_kernel_info)
 
-            # Load kernel history
-            if self.use_kernel_history:
-                self.app.create_background_task(self.load_history())
-
             # Run queued kernel tasks when the kernel is idle
             log.debug("Running %d kernel tasks", len(self.kernel_queue))
-            while self.kernel_queue:
-                self.kernel_queue.popleft()()
+            self._drain_kernel_queue()
 
         self.app.invalidate()
 
+    def _drain_kernel_queue(self) -> None:
+        """Run all queued kernel tasks.
+
+        The queue can be drained from the kernel thread (on start-up) and the
+        app thread (on enqueue) at once, so guard each pop against the other
+        drain emptying the queue between the check and the pop.
+        """
+        while self.kernel_queue:
+            try:
+                task = self.kernel_queue.popleft()
+            except IndexError:
+                break
+            task()
+
+    def enqueue_kernel_task(self, task: Callable) -> None:
+        """Queue a task to run once the kernel has started.
+
+        If the kernel finished starting between the caller's status check and
+        the task being queued, the queue will already have been drained, so it
+        is drained again here rather than leaving the task stranded.
+        """
+        self.kernel_queue.append(task)
+        if self.kernel.status in ("idle", "busy"):
+            self._drain_kernel_queue()
+
     def report_kernel_error(self, error: Exception | None) -> None:
         """Report a kernel error to the user."""
         log.debug("Kernel error", exc_info=error)
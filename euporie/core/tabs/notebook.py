@@ -370,7 +370,7 @@ class BaseNotebook(KernelTab, metaclass=ABCMeta):
         # Queue cell if kernel not yet started
         if self.kernel.status == "starting":
             log.debug("Queuing running of cell %s", cell.index)
-            self.kernel_queue.append(partial(self.run_cell, cell, wait, callback))
+            self.enqueue_kernel_task(partial(self.run_cell, cell, wait, callback))
         else:
             self.kernel.run(
                 str(cell.json.get("source")),
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from prompt_toolkit.validation import ValidationError, Validator
@@ -28,10 +29,19 @@ class KernelValidator(Validator):
             raise ValidationError
 
     async def validate_async(self, document: Document) -> None:
-        """Return a `Future` which is set when the validation is ready."""
-        completeness_status = (await self.kernel.is_complete_(code=document.text)).get(
-            "status", "unknown"
-        )
-        if completeness_status == "incomplete":
+        """Validate the input without blocking the application's event loop.
+
+        When the kernel runs in its own thread, the completeness request is
+        scheduled on the kernel's event loop, where the reply callbacks are
+        run, and awaited thread-safely from the calling loop.
+        """
+        kernel = self.kernel
+        coro = kernel.is_complete_(code=document.text)
+        if kernel.threaded:
+            result = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(coro, kernel.loop)
+            )
+        else:
+            result = await coro
+        if result.get("status", "unknown") == "incomplete":
             raise ValidationError
-        return
@@ -859,11 +859,9 @@ class Cell:
 
         """
         level = self.json["metadata"]
-        for i, key in enumerate(path):
-            if i == len(path) - 1:
-                level[key] = data
-            else:
-                level = level.setdefault(key, {})
+        for key in path[:-1]:
+            level = level.setdefault(key, {})
+        level[path[-1]] = data
 
     def set_status(self, status: str) -> None:
         """Set the execution status of the cell."""
@@ -417,6 +417,8 @@ class CellOutputArea:
         self.parent = parent
         self.style = style
         self.display_json: list[dict[str, Any]] = []
+        # Index into the display json of each stream output, by stream name
+        self._stream_index: dict[str, int] = {}
         self.rendered_outputs: list[CellOutput] = []
         self.container = HSplit([], style=lambda: self.style)
         self.children = self.container.children
@@ -439,6 +441,47 @@ class CellOutputArea:
                 self.add_output(new_output_json, refresh=False)
         get_app().invalidate()
 
+    def add_outputs(
+        self, outputs: list[dict[str, Any]], refresh: bool = True
+    ) -> None:
+        """Add a batch of new outputs to the output area.
+
+        Consecutive stream outputs on the same stream are concatenated before
+        being added, so the expensive parsing and rendering steps run once per
+        batch rather than once per stream fragment.
+
+        Args:
+            outputs: A list of cell output json dictionaries
+            refresh: Whether to request a redraw after adding the outputs
+
+        """
+        merged: list[dict[str, Any]] = []
+        # Buffer stream text fragments and join them in one pass, rather than
+        # copying all previously merged text on each concatenation
+        texts: list[str] = []
+
+        def _join_texts() -> None:
+            if len(texts) > 1:
+                merged[-1]["text"] = "".join(texts)
+            texts.clear()
+
+        for output_json in outputs:
+            name = output_json.get("name")
+            if merged and name and merged[-1].get("name") == name:
+                texts.append(output_json.get("text", ""))
+                continue
+            _join_texts()
+            if name:
+                # Copy stream outputs so merging does not modify the originals
+                output_json = dict(output_json)
+                texts.append(output_json.get("text", ""))
+            merged.append(output_json)
+        _join_texts()
+        for output_json in merged:
+            self.add_output(output_json, refresh=False)
+        if refresh:
+            get_app().invalidate()
+
     def add_output(self, output_json: dict[str, Any], refresh: bool = True) -> None:
         """Add a new output to the output area."""
         # Update json
@@ -446,15 +489,14 @@ class CellOutputArea:
         # Update display json
         add_output = True
         if name := output_json.get("name"):
-            for existing_output, rendered_output in zip(
-                self.display_json, self.rendered_outputs
-            ):
-                if name == existing_output.get("name"):
-                    existing_output["text"] += output_json.get("text", "")
-                    rendered_output.update()
-                    add_output = False
-                    break
+            # Look up any existing output for this stream by index
+            if (index := self._stream_index.get(name)) is not None:
+                self.display_json[index]["text"] += output_json.get("text", "")
+                self.rendered_outputs[index].update()
+                add_output = False
         if add_output:
+            if name:
+                self._stream_index[name] = len(self.display_json)
             # Add a copy to the display json so the original does not get modified
             output_json_copy = dict(output_json)
             self.display_json.append(output_json_copy)
@@ -475,6 +517,7 @@ class CellOutputArea:
         self.style = ""
         self._json.clear()
         self.display_json.clear()
+        self._stream_index.clear()
         self.rendered_outputs.clear()
         self.children.clear()
 
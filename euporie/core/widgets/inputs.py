@@ -216,10 +216,13 @@ class KernelInput(TextArea):
         self.has_focus: Filter = has_focus(self.buffer)
 
         # Set up autoinspect
+        # Cache the setting item, as its value is checked on every cursor move
+        autoinspect_setting = app.config.get_item("autoinspect")
+
         def _on_cursor_position_changed(buf: Buffer) -> None:
             """Respond to cursor movements."""
             # Update contextual help
-            if app.config.autoinspect and self.buffer.name == "code":
+            if autoinspect_setting.value and self.buffer.name == "code":
                 app.create_background_task(self.inspect(auto=True))
             elif pager := app.pager:
                 pager.hide()
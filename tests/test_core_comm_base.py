@@ -98,7 +98,7 @@ class TestComm:
         """Create a new CommView instance."""
         parent = Mock(spec=MockOutputParent)
         view = comm.new_view(parent)
-        assert comm.views[view] == parent
+        assert [(ref(), p_ref()) for ref, p_ref in comm.views] == [(view, parent)]
 
     def test_update_views(self, comm: Comm) -> None:
         """Create a new CommView instance."""
@@ -10,51 +10,31 @@ from euporie.core.ft.ansi import ANSI
 def test_ansi_tabs() -> None:
     """Tabs are converted to spaces."""
     value = ANSI("1\t23\t234\t5", tab_size=3)
-    assert to_formatted_text(value) == [
-        ("", "1"),
-        ("", " "),
-        ("", " "),
-        ("", "2"),
-        ("", "3"),
-        ("", " "),
-        ("", "2"),
-        ("", "3"),
-        ("", "4"),
-        ("", " "),
-        ("", " "),
-        ("", " "),
-        ("", "5"),
-    ]
+    assert to_formatted_text(value) == [("", "1  23 234   5")]
 
 
 def test_ansi_win_newlines() -> None:
     """Windows newlines are converted to Unix newlines."""
     value = ANSI("a\nb\r\nc")
-    assert to_formatted_text(value) == [
-        ("", "a"),
-        ("", "\n"),
-        ("", "b"),
-        ("", "\n"),
-        ("", "c"),
-    ]
+    assert to_formatted_text(value) == [("", "a\nb\nc")]
 
 
 def test_ansi_carriage_returns() -> None:
     """Line text preceding carriage returns is removed."""
     value = ANSI("a\nb\rc")
-    assert to_formatted_text(value) == [("", "a"), ("", "\n"), ("", "c")]
+    assert to_formatted_text(value) == [("", "a\nc")]
 
 
 def test_ansi_remove_hide_show_cursor() -> None:
     """Cursor show/hide commands are removed."""
     value = ANSI("a\x1b[?25hb\x1b[?25lc")
-    assert to_formatted_text(value) == [("", "a"), ("", "b"), ("", "c")]
+    assert to_formatted_text(value) == [("", "abc")]
 
 
 def test_ansi_clear_line() -> None:
     """Line text before clear line commands is removed."""
     value = ANSI("a\nb\x1b[2Kc")
-    assert to_formatted_text(value) == [("", "a"), ("", "\n"), ("", "c")]
+    assert to_formatted_text(value) == [("", "a\nc")]
 
 
 def test_ansi_zwe() -> None:
@@ -81,11 +61,8 @@ def test_ansi_colors() -> None:
     """ANSI color formatting is applied."""
     value = ANSI("\x1b[32mHe\x1b[45mllo")
     assert to_formatted_text(value) == [
-        ("ansigreen", "H"),
-        ("ansigreen", "e"),
-        ("ansigreen bg:ansimagenta", "l"),
-        ("ansigreen bg:ansimagenta", "l"),
-        ("ansigreen bg:ansimagenta", "o"),
+        ("ansigreen", "He"),
+        ("ansigreen bg:ansimagenta", "llo"),
     ]
 
 
@@ -93,11 +70,8 @@ def test_ansi_bold() -> None:
     """ANSI color bold is applied."""
     value = ANSI("\x1b[1mhe\x1b[0mllo")
     assert to_formatted_text(value) == [
-        ("bold", "h"),
-        ("bold", "e"),
-        ("", "l"),
-        ("", "l"),
-        ("", "o"),
+        ("bold", "he"),
+        ("", "llo"),
     ]
 
 
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
 @pytest.fixture()
 def kernel() -> Kernel:
     """Return a mock kernel object."""
-    return Mock()
+    return Mock(threaded=False)
 
 
 def test_validate(kernel: Mock) -> None:
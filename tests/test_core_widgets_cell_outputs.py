@@ -0,0 +1,28 @@
+"""Test the cell output area widgets."""
+
+from __future__ import annotations
+
+from euporie.core.widgets.cell_outputs import CellOutputArea
+
+
+def test_add_outputs_merges_stream_fragments() -> None:
+    """Consecutive same-stream fragments in a batch are concatenated."""
+    area = CellOutputArea([], parent=None)
+    area.add_outputs(
+        [
+            {"output_type": "stream", "name": "stdout", "text": "a"},
+            {"output_type": "stream", "name": "stdout", "text": "b"},
+            {"output_type": "stream", "name": "stderr", "text": "err"},
+        ]
+    )
+    assert len(area.json) == 2
+    assert area.display_json[0]["text"] == "ab"
+    assert area.display_json[1]["text"] == "err"
+
+
+def test_add_outputs_does_not_modify_originals() -> None:
+    """Merging stream fragments copies rather than mutating the inputs."""
+    first = {"output_type": "stream", "name": "stdout", "text": "a"}
+    area = CellOutputArea([], parent=None)
+    area.add_outputs([first, {"output_type": "stream", "name": "stdout", "text": "b"}])
+    assert first["text"] == "a"